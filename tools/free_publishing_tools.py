@@ -5,7 +5,6 @@ Modified to save locally first and publish to free platforms like Dev.to
 
 import os
 import json
-import requests
 from typing import Dict, List, Any, Optional
 from crewai.tools import BaseTool
 from pydantic import Field
@@ -13,178 +12,135 @@ import time
 import re
 from pathlib import Path
 from datetime import datetime
-from pydantic import Field
-
-
-
-class LocalBlogSaverTool(BaseTool):
-    name: str = "Local Blog Saver"
-    description: str = "Save generated blog posts locally with images and metadata"
-    
-    def _run(self, title: str, content: str, images_data: str = "", topic: str = "") -> str:
-        """
-        Save blog post locally in organized structure
-        
-        Args:
-            title: Blog post title
-            content: Blog post content in Markdown
-            images_data: JSON string with image information
-            topic: Original topic for organization
-        """
-        try:
-            # Create organized directory structure
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_topic = safe_topic.replace(' ', '-').lower()
-            
-            # Create directories
-            base_dir = Path('local_blogs')
-            blog_dir = base_dir / f"{timestamp}_{safe_topic}"
-            blog_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save main blog post
-            blog_file = blog_dir / 'blog_post.md'
-            with open(blog_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Save metadata
-            metadata = {
-                'title': title,
-                'topic': topic,
-                'created_at': timestamp,
-                'word_count': len(content.split()),
-                'char_count': len(content),
-                'estimated_read_time': max(1, len(content.split()) // 200),
-                'status': 'draft',
-                'platforms': {
-                    'devto': {'published': False, 'url': ''},
-                    'hashnode': {'published': False, 'url': ''},
-                    'local_saved': True
-                }
-            }
-            
-            metadata_file = blog_dir / 'metadata.json'
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
-            
-            # Process and save images
-            if images_data:
-                try:
-                    images = json.loads(images_data)
-                    images_dir = blog_dir / 'images'
-                    images_dir.mkdir(exist_ok=True)
-                    
-                    # Save image metadata
-                    image_metadata_file = images_dir / 'images_metadata.json'
-                    with open(image_metadata_file, 'w', encoding='utf-8') as f:
-                        json.dump(images, f, indent=2)
-                    
-                    # Create image download instructions
-                    download_script = self._create_image_download_script(images, images_dir)
-                    download_script_file = images_dir / 'download_images.py'
-                    with open(download_script_file, 'w', encoding='utf-8') as f:
-                        f.write(download_script)
-                    
-                except json.JSONDecodeError:
-                    pass  # Skip images if invalid JSON
-            
-            # Create publication instructions
-            pub_instructions = self._create_publication_instructions(title, blog_file, metadata)
-            instructions_file = blog_dir / 'publication_instructions.md'
-            with open(instructions_file, 'w', encoding='utf-8') as f:
-                f.write(pub_instructions)
-            
-            return json.dumps({
-                'success': True,
-                'blog_directory': str(blog_dir),
-                'files_created': {
-                    'blog_post': str(blog_file),
-                    'metadata': str(metadata_file),
-                    'instructions': str(instructions_file),
-                    'images_dir': str(blog_dir / 'images') if images_data else None
-                },
-                'metadata': metadata,
-                'next_steps': [
-                    f"Review the blog post at: {blog_file}",
-                    f"Check publication instructions: {instructions_file}",
-                    "Edit content if needed before publishing",
-                    "Run the publishing script when ready"
-                ]
-            }, indent=2)
-            
-        except Exception as e:
-            return json.dumps({
-                'error': f"Error saving blog locally: {str(e)}",
-                'title': title
-            })
-    
-    def _create_image_download_script(self, images_data: Dict, images_dir: Path) -> str:
-        """Create Python script to download images"""
-        
-        script = '''#!/usr/bin/env python3
+from itertools import islice
+
+
+# Precompiled sanitization patterns (compiled once at import)
+_UNSAFE = re.compile(r'[^\w\- ]+')
+_TAG_ITEM = re.compile(r'[^,]+')
+_TITLE_SLUG_TRANS = str.maketrans({' ': '-'})
+
+
+def _iter_tags(tags: str):
+    """Yield unique, non-empty lowercase tags lazily in the order given"""
+    seen = set()
+    for match in _TAG_ITEM.finditer(tags):
+        tag = match.group().strip().lower()
+        if tag and tag not in seen:
+            seen.add(tag)
+            yield tag
+
+
+# Shared HTTP session so publishes reuse pooled TCP/TLS connections.
+# Created on first use so importing this module for local saving only
+# does not pay the requests/urllib3/ssl import cost.
+_SESSION = None
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        # Article creation is not idempotent: only retry failed connects and
+        # statuses where the server did not process the request (429/503)
+        retry = Retry(
+            total=4,
+            connect=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        _SESSION.headers.update({
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        })
+    return _SESSION
+
+
+# Image download script template, filled in by str.format per save.
+# {images} is either an inlined image list or a load_images() call, in
+# which case {loader} adds that function; either way images are saved
+# next to the script in the images/ directory.
+_DOWNLOAD_SCRIPT_TEMPLATE = '''#!/usr/bin/env python3
 """
 Script to download images for the blog post
 Run this script to download all images locally
 """
 
 import requests
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-def download_image(url, filename):
+{loader}
+def download_image(session, url, filename):
     """Download image from URL"""
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        with open(filename, 'wb') as f:
-            f.write(response.content)
+        with session.get(url, stream=True, timeout=(3.05, 30)) as response:
+            response.raise_for_status()
+            
+            with open(filename, 'wb') as f:
+                for chunk in response.iter_content(65536):
+                    f.write(chunk)
         
-        print(f"✅ Downloaded: {filename}")
+        print(f"✅ Downloaded: {{filename}}")
         return True
         
     except Exception as e:
-        print(f"❌ Failed to download {url}: {str(e)}")
+        print(f"❌ Failed to download {{url}}: {{str(e)}}")
         return False
 
 def main():
     """Download all images"""
-    images_to_download = [
-'''
-        
-        # Add image download data
-        if 'optimized_images' in images_data:
-            for img in images_data['optimized_images']:
-                script += f'        {{\n'
-                script += f'            "url": "{img.get("download_url", "")}",\n'
-                script += f'            "filename": "{img.get("file_name", "image.jpg")}",\n'
-                script += f'            "alt_text": "{img.get("alt_text", "")}"\n'
-                script += f'        }},\n'
-        
-        script += '''    ]
+    images_dir = Path(__file__).resolve().parent
+    images_to_download = {images}
     
-    print(f"📥 Downloading {len(images_to_download)} images...")
+    print(f"📥 Downloading {{len(images_to_download)}} images...")
     
-    success_count = 0
-    for img in images_to_download:
-        if download_image(img["url"], img["filename"]):
-            success_count += 1
+    session = requests.Session()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(download_image, session, img["url"], images_dir / img["filename"])
+            for img in images_to_download
+        ]
+        success_count = sum(1 for future in futures if future.result())
     
-    print(f"\\n✅ Downloaded {success_count}/{len(images_to_download)} images successfully")
+    print(f"\\n✅ Downloaded {{success_count}}/{{len(images_to_download)}} images successfully")
 
 if __name__ == "__main__":
     main()
 '''
-        
-        return script
-    
-    def _create_publication_instructions(self, title: str, blog_file: Path, metadata: Dict) -> str:
-        """Create instructions for publishing to various platforms"""
-        
-        instructions = f'''# Publication Instructions for: {title}
+
+# Runtime loader spliced into the download script when the image list is
+# not inlined at save time
+_LOAD_IMAGES_SOURCE = '''import json
+
+def load_images(images_dir):
+    """Read the image list from images_metadata.json"""
+    images_data = json.loads((images_dir / 'images_metadata.json').read_text(encoding='utf-8'))
+    if not isinstance(images_data, dict):
+        return []  # Only an object can carry optimized_images
+    return [
+        {
+            "url": str(img.get("download_url") or ""),
+            "filename": str(img.get("file_name") or "image.jpg"),
+            "alt_text": str(img.get("alt_text") or "")
+        }
+        for img in images_data.get('optimized_images', [])
+    ]
+'''
+
+# Publication instructions template, filled in by str.format per save
+_PUB_TEMPLATE = '''# Publication Instructions for: {title}
 
 ## 📁 Files Overview
-- **Blog Post**: `{blog_file.name}`
+- **Blog Post**: `{blog_file_name}`
 - **Metadata**: `metadata.json`
 - **Images**: `images/` directory (run `python images/download_images.py` first)
 
@@ -207,7 +163,7 @@ if __name__ == "__main__":
    ```
 
 3. **Manual Publishing**:
-   - Copy content from `{blog_file.name}`
+   - Copy content from `{blog_file_name}`
    - Go to https://dev.to/new
    - Paste content and publish
 
@@ -232,7 +188,7 @@ if __name__ == "__main__":
 2. **Add Blog Post**:
    ```bash
    # Copy to Jekyll _posts directory
-   cp {blog_file.name} ../_posts/{datetime.now().strftime("%Y-%m-%d")}-{title.lower().replace(" ", "-")}.md
+   cp {blog_file_name} ../_posts/{date}-{slug}.md
    ```
 
 ### Option 4: Manual Publishing
@@ -253,14 +209,14 @@ Copy the content and publish manually to any platform:
 
 ## 📊 Blog Statistics
 
-- **Word Count**: {metadata.get("word_count", "N/A")}
-- **Estimated Read Time**: {metadata.get("estimated_read_time", "N/A")} minutes
-- **Created**: {metadata.get("created_at", "N/A")}
+- **Word Count**: {word_count}
+- **Estimated Read Time**: {read_time} minutes
+- **Created**: {created_at}
 
 ## 🏷️ Suggested Tags
 
-Based on your topic "{metadata.get("topic", "")}", consider these tags:
-- {metadata.get("topic", "").lower().replace(" ", "")}
+Based on your topic "{topic}", consider these tags:
+- {topic_tag}
 - programming
 - technology
 - ai
@@ -268,8 +224,150 @@ Based on your topic "{metadata.get("topic", "")}", consider these tags:
 
 Happy publishing! 🎉
 '''
+
+
+class LocalBlogSaverTool(BaseTool):
+    name: str = "Local Blog Saver"
+    description: str = "Save generated blog posts locally with images and metadata"
+    
+    def _run(self, title: str, content: str, images_data: str = "", topic: str = "",
+             inline_image_list: bool = True) -> str:
+        """
+        Save blog post locally in organized structure
+        
+        Args:
+            title: Blog post title
+            content: Blog post content in Markdown
+            images_data: JSON string with image information
+            topic: Original topic for organization
+            inline_image_list: Inline the image list into download_images.py; when False
+                the script reads images_metadata.json at runtime instead
+        """
+        try:
+            # Create organized directory structure
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            safe_topic = _UNSAFE.sub('', topic).strip().replace(' ', '-').lower()
+            
+            # Parse images up front so all directories can be created in one call
+            images = None
+            if images_data:
+                try:
+                    images = json.loads(images_data)
+                except json.JSONDecodeError:
+                    pass  # Skip images if invalid JSON
+            
+            # Create directories
+            blog_dir = Path('local_blogs', f"{timestamp}_{safe_topic}")
+            images_dir = blog_dir / 'images'
+            os.makedirs(images_dir if images is not None else blog_dir, exist_ok=True)
+            
+            # Save main blog post
+            blog_file = blog_dir / 'blog_post.md'
+            blog_file.write_text(content, encoding='utf-8')
+            
+            # Save metadata
+            word_count = len(content.split())
+            metadata = {
+                'title': title,
+                'topic': topic,
+                'created_at': timestamp,
+                'word_count': word_count,
+                'char_count': len(content),
+                'estimated_read_time': max(1, word_count // 200),
+                'status': 'draft',
+                'platforms': {
+                    'devto': {'published': False, 'url': ''},
+                    'hashnode': {'published': False, 'url': ''},
+                    'local_saved': True
+                }
+            }
+            
+            metadata_file = blog_dir / 'metadata.json'
+            metadata_file.write_text(json.dumps(metadata, indent=2, ensure_ascii=False), encoding='utf-8')
+            
+            # Save images
+            if images is not None:
+                # Save image metadata
+                image_metadata_file = images_dir / 'images_metadata.json'
+                image_metadata_file.write_text(json.dumps(images, indent=2, ensure_ascii=False), encoding='utf-8')
+                
+                # Create image download instructions
+                if inline_image_list:
+                    download_script = self._create_image_download_script(images, images_dir)
+                else:
+                    download_script = _DOWNLOAD_SCRIPT_TEMPLATE.format(
+                        loader=_LOAD_IMAGES_SOURCE, images='load_images(images_dir)'
+                    )
+                download_script_file = images_dir / 'download_images.py'
+                download_script_file.write_text(download_script, encoding='utf-8')
+            
+            # Create publication instructions
+            pub_instructions = self._create_publication_instructions(title, blog_file, metadata, now)
+            instructions_file = blog_dir / 'publication_instructions.md'
+            instructions_file.write_text(pub_instructions, encoding='utf-8')
+            
+            return json.dumps({
+                'success': True,
+                'blog_directory': str(blog_dir),
+                'files_created': {
+                    'blog_post': str(blog_file),
+                    'metadata': str(metadata_file),
+                    'instructions': str(instructions_file),
+                    'images_dir': str(images_dir) if images_data else None
+                },
+                'metadata': metadata,
+                'next_steps': [
+                    f"Review the blog post at: {blog_file}",
+                    f"Check publication instructions: {instructions_file}",
+                    "Edit content if needed before publishing",
+                    "Run the publishing script when ready"
+                ]
+            }, indent=2)
+            
+        except Exception as e:
+            return json.dumps({
+                'error': f"Error saving blog locally: {str(e)}",
+                'title': title
+            })
+    
+    def _create_image_download_script(self, images_data: Any, images_dir: Path) -> str:
+        """Create Python script to download images"""
+        
+        # Valid JSON that is not an object (a bare list, a string) has no
+        # optimized_images; render an empty list rather than failing the save
+        optimized_images = images_data.get('optimized_images', []) if isinstance(images_data, dict) else []
+        
+        # Serialize the image list once; every value is coerced to str (null or
+        # numeric fields from LLM input included) so each JSON value is also a
+        # valid Python string literal
+        entries = [
+            {
+                "url": str(img.get("download_url") or ""),
+                "filename": str(img.get("file_name") or "image.jpg"),
+                "alt_text": str(img.get("alt_text") or "")
+            }
+            for img in optimized_images
+        ]
+        list_literal = json.dumps(entries, indent=4, ensure_ascii=False).replace('\n', '\n    ')
+        
+        return _DOWNLOAD_SCRIPT_TEMPLATE.format(loader='', images=list_literal)
+    
+    def _create_publication_instructions(self, title: str, blog_file: Path, metadata: Dict, now: datetime) -> str:
+        """Create instructions for publishing to various platforms"""
         
-        return instructions
+        topic = metadata.get("topic", "")
+        return _PUB_TEMPLATE.format(
+            title=title,
+            blog_file_name=blog_file.name,
+            date=now.strftime("%Y-%m-%d"),
+            slug=title.lower().translate(_TITLE_SLUG_TRANS),
+            word_count=metadata.get("word_count", "N/A"),
+            read_time=metadata.get("estimated_read_time", "N/A"),
+            created_at=metadata.get("created_at", "N/A"),
+            topic=topic,
+            topic_tag=topic.lower().replace(" ", "")
+        )
 
 
 class DevToPublisherTool(BaseTool):
@@ -307,7 +405,8 @@ class DevToPublisherTool(BaseTool):
             published = data.get('published', True)  # Default to True for direct publishing
             
             # Process tags
-            tags_list = [tag.strip().lower() for tag in tags.split(',')][:4] if tags else []
+            # Dev.to accepts at most 4 tags; stop parsing once we have them
+            tags_list = list(islice(_iter_tags(tags), 4)) if tags else []
             
             # API payload
             article_data = {
@@ -319,18 +418,17 @@ class DevToPublisherTool(BaseTool):
                 }
             }
             
-            # Headers
+            # Headers (Content-Type is set once on the shared session)
             headers = {
-                "api-key": self.api_key,
-                "Content-Type": "application/json"
+                "api-key": self.api_key
             }
             
             # Make API call
-            response = requests.post(
+            response = _get_session().post(
                 "https://dev.to/api/articles",
                 headers=headers,
                 json=article_data,
-                timeout=15
+                timeout=(3.05, 15)  # (connect, read)
             )
             
             if response.status_code == 201:
@@ -345,7 +443,7 @@ class DevToPublisherTool(BaseTool):
                 return json.dumps({
                     'success': False,
                     'error': f'HTTP {response.status_code}',
-                    'details': response.text[:200]
+                    'details': response.content[:200].decode('utf-8', errors='replace')
                 })
                 
         except json.JSONDecodeError:
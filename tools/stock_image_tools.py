@@ -5,13 +5,71 @@ Replaces AI image generation with curated stock images from Unsplash and Pexels
 
 import os
 import json
+import re
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Union
 from crewai.tools import BaseTool
 from urllib.parse import quote
 import time
 from pydantic import Field
 
+from utils.cache import TTLCache
+
+
+# Characters dropped from topics when building image filenames
+_FILENAME_UNSAFE = re.compile(r'[^\w\- ]+')
+
+# Topic and description words worth keeping as keywords (letters only, so
+# punctuation never sticks to a word), and filler words that make poor
+# image SEO keywords
+_TOPIC_WORD = re.compile(r'[^\W\d_]{3,}')
+_DESC_WORD = re.compile(r'[^\W\d_]{4,}')
+_STOPWORDS = frozenset({
+    'the', 'and', 'for', 'with', 'from', 'into', 'about', 'your', 'you',
+    'are', 'how', 'what', 'why', 'this', 'that', 'over', 'its', 'our'
+})
+
+# Usage type by image position (anything past the table is supplementary)
+# and the recommended dimensions for each usage type
+_USAGE_BY_INDEX = ('featured', 'supporting', 'supporting', 'supporting')
+_SIZE_MAP = {
+    "featured": {"width": 1200, "height": 630, "description": "Social media optimized"},
+    "supporting": {"width": 800, "height": 450, "description": "In-content image"},
+    "supplementary": {"width": 600, "height": 400, "description": "Secondary content"}
+}
+
+# Pexels src variants kept in search results by default; the optimizer only
+# picks from large/medium, and original/small cover full-size and thumbnails
+_SRC_SIZES = ('original', 'large', 'medium', 'small')
+
+# Shared HTTP session so repeated image searches reuse pooled keep-alive
+# connections instead of a fresh TCP/TLS handshake per call
+_SESSION = None
+
+
+def _get_session() -> requests.Session:
+    """Return the shared requests session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        # Searches are idempotent GETs, so transient failures are safe to retry
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return _SESSION
+
+
+# Small in-process LRU cache of raw Pexels responses keyed by
+# (query, per_page, orientation); entries expire after an hour
+_search_cache = TTLCache(maxsize=128, ttl_seconds=3600)
+
 
 class PexelsSearchTool(BaseTool):
     name: str = "Pexels Stock Image Search"
@@ -26,7 +84,8 @@ class PexelsSearchTool(BaseTool):
             raise ValueError("PEXELS_API_KEY environment variable is required")
         self.base_url = "https://api.pexels.com/v1"
         
-    def _run(self, query: str, count: int = 2, orientation: str = "landscape") -> str:
+    def _run(self, query: str, count: int = 2, orientation: str = "landscape",
+             include_all_sizes: bool = False) -> str:
         """
         Search for stock images on Pexels
         
@@ -34,6 +93,7 @@ class PexelsSearchTool(BaseTool):
             query: Search terms for images
             count: Number of images to return (max 40)
             orientation: Image orientation (landscape, portrait, square)
+            include_all_sizes: Return every Pexels size variant, not just the common ones
         """
         try:
             url = f"{self.base_url}/search"
@@ -47,28 +107,27 @@ class PexelsSearchTool(BaseTool):
                 "orientation": orientation
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            cache_key = (query.strip().lower(), params["per_page"], orientation)
+            data = _search_cache.get(cache_key)
+            if data is None:
+                response = _get_session().get(url, headers=headers, params=params, timeout=(3.05, 10))
+                response.raise_for_status()
+                
+                data = response.json()
+                _search_cache.put(cache_key, data)
             
             images = []
+            default_description = f"Professional stock photo related to {query}"
             for photo in data.get('photos', []):
+                src = photo['src']
+                photographer = photo['photographer']
+                page_url = photo['url']
                 image_info = {
                     'id': photo['id'],
-                    'description': photo.get('alt', f"Professional stock photo related to {query}"),
-                    'urls': {
-                        'original': photo['src']['original'],
-                        'large2x': photo['src']['large2x'],
-                        'large': photo['src']['large'],
-                        'medium': photo['src']['medium'],
-                        'small': photo['src']['small'],
-                        'portrait': photo['src']['portrait'],
-                        'landscape': photo['src']['landscape'],
-                        'tiny': photo['src']['tiny']
-                    },
+                    'description': photo.get('alt', default_description),
+                    'urls': dict(src) if include_all_sizes else {k: src[k] for k in _SRC_SIZES if k in src},
                     'photographer': {
-                        'name': photo['photographer'],
+                        'name': photographer,
                         'profile': photo['photographer_url']
                     },
                     'dimensions': {
@@ -76,9 +135,9 @@ class PexelsSearchTool(BaseTool):
                         'height': photo['height']
                     },
                     'average_color': photo.get('avg_color', '#ffffff'),
-                    'pexels_url': photo['url'],
-                    'attribution': f"Photo by {photo['photographer']} from Pexels",
-                    'attribution_url': photo['url'],
+                    'pexels_url': page_url,
+                    'attribution': f"Photo by {photographer} from Pexels",
+                    'attribution_url': page_url,
                     'license': "Pexels License (https://www.pexels.com/license/)",
                     'source': 'pexels'
                 }
@@ -111,17 +170,21 @@ class ImageOptimizerTool(BaseTool):
     name: str = "Stock Image Optimizer and Curator"
     description: str = "Optimize and curate stock images for blog publication with SEO and attribution"
     
-    def _run(self, image_data: str, blog_topic: str, blog_content: str = "") -> str:
+    def _run(self, image_data: Union[str, Dict[str, Any]], blog_topic: str, blog_content: str = "") -> str:
         """
         Process and optimize stock images for blog use
         
         Args:
-            image_data: JSON string containing image information from search tools
+            image_data: JSON string (or already-parsed dict) containing image information from search tools
             blog_topic: The blog post topic for context
             blog_content: Optional blog content for better image selection
         """
         try:
-            data = json.loads(image_data)
+            # In-process callers can pass the parsed search result and skip a JSON round-trip
+            if isinstance(image_data, str):
+                data = json.loads(image_data)
+            else:
+                data = image_data
             
             if 'error' in data:
                 return json.dumps({
@@ -138,17 +201,22 @@ class ImageOptimizerTool(BaseTool):
                     'blog_topic': blog_topic
                 })
             
+            # Per-topic values are the same for every image; derive them once
+            topic_slug = self._topic_slug(blog_topic)
+            topic_keywords = self._topic_keywords(blog_topic)
+            
             # Prioritize images for different uses
             for i, image in enumerate(images):
-                usage_type = self._determine_image_usage(i, len(images))
+                usage_type = _USAGE_BY_INDEX[i] if i < len(_USAGE_BY_INDEX) else 'supplementary'
+                description = (image.get('description') or '').strip()
                 
                 optimized = {
                     'id': image['id'],
                     'source': image.get('source', 'unknown'),
                     'usage_type': usage_type,
-                    'recommended_size': self._get_recommended_size(usage_type),
-                    'alt_text': self._generate_alt_text(image.get('description', ''), blog_topic, usage_type),
-                    'file_name': self._generate_filename(blog_topic, image['id'], usage_type),
+                    'recommended_size': _SIZE_MAP[usage_type],
+                    'alt_text': self._generate_alt_text(description, blog_topic, usage_type),
+                    'file_name': self._generate_filename(topic_slug, image['id'], usage_type),
                     'download_url': self._select_optimal_url(image['urls'], usage_type),
                     'attribution': image.get('attribution', ''),
                     'attribution_url': image.get('attribution_url', ''),
@@ -156,16 +224,17 @@ class ImageOptimizerTool(BaseTool):
                     'license': image.get('license', ''),
                     'dimensions': image.get('dimensions', {}),
                     'placement_suggestion': self._suggest_placement(usage_type, i),
-                    'seo_keywords': self._extract_seo_keywords(blog_topic, image.get('description', '')),
-                    'caption_suggestion': self._generate_caption(image.get('description', ''), blog_topic)
+                    'seo_keywords': self._extract_seo_keywords(topic_keywords, description),
+                    'caption_suggestion': self._generate_caption(description, blog_topic)
                 }
                 optimized_images.append(optimized)
             
             return json.dumps({
                 'blog_topic': blog_topic,
                 'total_images': len(optimized_images),
+                # Supporting images are the non-featured entries of optimized_images
+                # (see each entry's usage_type), so they are not listed twice
                 'featured_image': optimized_images[0] if optimized_images else None,
-                'supporting_images': optimized_images[1:] if len(optimized_images) > 1 else [],
                 'optimized_images': optimized_images,
                 'attribution_block': self._generate_attribution_block(optimized_images),
                 'seo_summary': self._generate_seo_summary(optimized_images),
@@ -183,28 +252,10 @@ class ImageOptimizerTool(BaseTool):
                 'blog_topic': blog_topic
             })
     
-    def _determine_image_usage(self, index: int, total_images: int) -> str:
-        """Determine the usage type for an image based on its position"""
-        if index == 0:
-            return "featured"
-        elif index < 4:
-            return "supporting"
-        else:
-            return "supplementary"
-    
-    def _get_recommended_size(self, usage_type: str) -> Dict[str, int]:
-        """Get recommended dimensions based on usage type"""
-        size_map = {
-            "featured": {"width": 1200, "height": 630, "description": "Social media optimized"},
-            "supporting": {"width": 800, "height": 450, "description": "In-content image"},
-            "supplementary": {"width": 600, "height": 400, "description": "Secondary content"}
-        }
-        return size_map.get(usage_type, size_map["supporting"])
-    
     def _generate_alt_text(self, description: str, topic: str, usage_type: str) -> str:
         """Generate SEO-friendly alt text for images"""
-        if description and description.strip():
-            base_alt = description.strip()
+        if description:
+            base_alt = description
         else:
             base_alt = f"Professional image related to {topic}"
         
@@ -214,13 +265,14 @@ class ImageOptimizerTool(BaseTool):
         else:
             return f"{base_alt} - Illustrating {topic} concepts"
     
-    def _generate_filename(self, topic: str, image_id: str, usage_type: str) -> str:
+    def _topic_slug(self, topic: str) -> str:
+        """Clean a topic into a lowercase, hyphenated filename prefix"""
+        clean_topic = _FILENAME_UNSAFE.sub('', topic).rstrip()
+        return clean_topic.replace(' ', '-').lower()
+    
+    def _generate_filename(self, topic_slug: str, image_id: str, usage_type: str) -> str:
         """Generate SEO-friendly filename"""
-        # Clean topic for filename
-        clean_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        clean_topic = clean_topic.replace(' ', '-').lower()
-        
-        return f"{clean_topic}-{usage_type}-{image_id}.jpg"
+        return f"{topic_slug}-{usage_type}-{image_id}.jpg"
     
     def _select_optimal_url(self, urls: Dict[str, str], usage_type: str) -> str:
         """Select the best image URL based on usage type"""
@@ -242,26 +294,26 @@ class ImageOptimizerTool(BaseTool):
         else:
             return f"Section {index} or conclusion"
     
-    def _extract_seo_keywords(self, topic: str, description: str) -> List[str]:
-        """Extract SEO keywords from topic and description"""
-        keywords = []
-        
-        # Add topic-related keywords
-        topic_words = [word.strip().lower() for word in topic.split() if len(word) > 2]
-        keywords.extend(topic_words)
+    def _topic_keywords(self, topic: str) -> List[str]:
+        """Extract topic keywords (shared by every image in a run)"""
+        return [word for word in _TOPIC_WORD.findall(topic.lower()) if word not in _STOPWORDS]
+    
+    def _extract_seo_keywords(self, topic_keywords: List[str], description: str) -> List[str]:
+        """Extract SEO keywords from topic keywords and description"""
+        keywords = list(topic_keywords)
         
         # Extract from description
         if description:
-            desc_words = [word.strip().lower() for word in description.split() if len(word) > 3]
+            desc_words = [word for word in _DESC_WORD.findall(description.lower()) if word not in _STOPWORDS]
             keywords.extend(desc_words[:3])  # Limit to top 3 descriptive words
         
-        # Remove duplicates and return
-        return list(set(keywords))[:5]  # Limit to 5 keywords
+        # Remove duplicates (keeping order so output is stable) and return
+        return list(dict.fromkeys(keywords))[:5]  # Limit to 5 keywords
     
     def _generate_caption(self, description: str, topic: str) -> str:
         """Generate a caption for the image"""
-        if description and len(description.strip()) > 10:
-            return f"{description.strip()}"
+        if len(description) > 10:
+            return description
         else:
             return f"Visual representation of {topic} concepts"
     
@@ -280,18 +332,23 @@ class ImageOptimizerTool(BaseTool):
     
     def _generate_seo_summary(self, optimized_images: List[Dict]) -> Dict[str, Any]:
         """Generate SEO summary for the image collection"""
-        total_keywords = []
-        total_alt_text = []
+        unique_keywords = set()
+        alt_text_count = 0
+        alt_text_length = 0
         
+        # Accumulate the running totals in one pass instead of collecting lists
         for img in optimized_images:
             if img.get('seo_keywords'):
-                total_keywords.extend(img['seo_keywords'])
-            if img.get('alt_text'):
-                total_alt_text.append(img['alt_text'])
+                unique_keywords.update(img['seo_keywords'])
+            alt_text = img.get('alt_text')
+            if alt_text:
+                alt_text_count += 1
+                alt_text_length += len(alt_text)
         
+        total_images = len(optimized_images)
         return {
-            'total_images': len(optimized_images),
-            'unique_keywords': len(set(total_keywords)),
-            'avg_alt_text_length': sum(len(alt) for alt in total_alt_text) // len(total_alt_text) if total_alt_text else 0,
-            'seo_compliance': 'good' if len(total_alt_text) == len(optimized_images) else 'needs_improvement'
+            'total_images': total_images,
+            'unique_keywords': len(unique_keywords),
+            'avg_alt_text_length': alt_text_length // alt_text_count if alt_text_count else 0,
+            'seo_compliance': 'good' if alt_text_count == total_images else 'needs_improvement'
         }
\ No newline at end of file
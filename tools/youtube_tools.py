@@ -7,14 +7,94 @@ Falls back to video description when transcripts are unavailable
 import os
 import json
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from collections import Counter
+import heapq
+from operator import itemgetter
 from pydantic import Field
 from crewai.tools import BaseTool
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 
+from utils.cache import TTLCache
+
+
+# Partial-response selectors: ask the Data API for only the fields read below
+_SEARCH_FIELDS = 'items(id/videoId)'
+_VIDEO_FIELDS = (
+    'items(id,'
+    'snippet(title,description,publishedAt,channelTitle,channelId,thumbnails/high/url),'
+    'statistics(viewCount,likeCount,commentCount),'
+    'contentDetails/duration)'
+)
+
+# Precompiled patterns for duration parsing, transcript cleanup and analysis
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_WS_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_TOPIC_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+_STAT_RE = re.compile('|'.join((
+    r'\d+\s*percent',
+    r'\d+%',
+    r'\$\d+[\d,]*',
+    r'\d+\s*million',
+    r'\d+\s*billion',
+    r'\d+\s*times',
+    r'\d+\s*years?',
+    r'\d+\s*months?'
+)), re.IGNORECASE)
+
+# Static lookup tables shared by every call (tuples, so safe to share)
+_FALLBACK_LANGUAGES = ('en', 'en-US', 'en-GB', 'en-CA', 'en-AU')
+_INSIGHT_KEYWORDS = (
+    'important', 'key', 'crucial', 'essential', 'main point',
+    'remember', 'tip', 'advice', 'recommendation', 'secret',
+    'mistake', 'avoid', 'best practice', 'lesson', 'takeaway'
+)
+_QUOTE_INDICATORS = (
+    '"', "'", 'i believe', 'i think', 'in my opinion',
+    'the key is', 'what matters', 'most important'
+)
+_SUMMARY_WORDS = ('important', 'key', 'main', 'summary', 'conclusion')
+# One alternation per indicator list, searched against the lowercased
+# sentence; like the old `keyword in sentence` loop these match substrings
+_INSIGHT_RE = re.compile('|'.join(map(re.escape, _INSIGHT_KEYWORDS)))
+_QUOTE_RE = re.compile('|'.join(map(re.escape, _QUOTE_INDICATORS)))
+# Filler words skipped when picking transcript topics
+_COMMON_WORDS = frozenset({
+    'that', 'this', 'with', 'have', 'will', 'been', 'were', 'said',
+    'what', 'your', 'they', 'them', 'like', 'just', 'know', 'think',
+    'really', 'going', 'want', 'need', 'make', 'time', 'people'
+})
+_ERROR_INDICATORS = ('[music]', '[applause]', '[inaudible]', 'um,', 'uh,', '...')
+# The markers never overlap one another, so one alternation scan counts the
+# same matches as a separate str.count per marker
+_ERROR_INDICATOR_RE = re.compile('|'.join(map(re.escape, _ERROR_INDICATORS)))
+
+# YouTube Data API clients keyed by API key. Each owns one httplib2.Http, so
+# reusing the client keeps the googleapis.com connection alive between calls
+_youtube_services: Dict[str, Any] = {}
+
+
+def _get_youtube_service(api_key: str) -> Any:
+    """Return the YouTube Data API client for api_key, building it on first use"""
+    service = _youtube_services.get(api_key)
+    if service is None:
+        # The bundled discovery document avoids fetching it over the network
+        service = build('youtube', 'v3', developerKey=api_key, http=build_http(),
+                        cache_discovery=False, static_discovery=True)
+        _youtube_services[api_key] = service
+    return service
+
+
+# Small in-process LRU caches so repeated searches and transcript fetches
+# within a run skip the API round trips; entries expire after an hour
+_search_cache = TTLCache(maxsize=64, ttl_seconds=3600)
+_transcript_cache = TTLCache(maxsize=64, ttl_seconds=3600)
+
 
 class YouTubeSearchTool(BaseTool):
     name: str = "YouTube Video Search"
@@ -27,7 +107,7 @@ class YouTubeSearchTool(BaseTool):
         self.api_key = os.getenv('YOUTUBE_API_KEY')
         if not self.api_key:
             raise ValueError("YOUTUBE_API_KEY environment variable is required")
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        self.youtube = _get_youtube_service(self.api_key)
         
     def _run(self, topic: str, max_results: int = 10, days_back: int = 30) -> str:
         """
@@ -42,73 +122,89 @@ class YouTubeSearchTool(BaseTool):
             JSON string with video information including descriptions
         """
         try:
-            # Calculate date for filtering recent videos
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            published_after = cutoff_date.isoformat() + 'Z'
+            cache_key = (topic.strip().lower(), min(max_results, 50), days_back)
+            videos = _search_cache.get(cache_key)
+            if videos is None:
+                # Calculate date for filtering recent videos
+                cutoff_date = datetime.now() - timedelta(days=days_back)
+                published_after = cutoff_date.isoformat() + 'Z'
             
-            # Search for videos
-            search_response = self.youtube.search().list(
-                q=topic,
-                part='snippet',
-                type='video',
-                order='relevance',
-                maxResults=min(max_results, 50),
-                publishedAfter=published_after,
-                videoDuration='medium',
-                videoDefinition='high',
-                safeSearch='moderate'
-            ).execute()
+                # Search for videos
+                search_response = self.youtube.search().list(
+                    q=topic,
+                    part='snippet',
+                    type='video',
+                    order='relevance',
+                    maxResults=min(max_results, 50),
+                    publishedAfter=published_after,
+                    videoDuration='medium',
+                    videoDefinition='high',
+                    safeSearch='moderate',
+                    fields=_SEARCH_FIELDS
+                ).execute()
             
-            videos = []
-            video_ids = [item['id']['videoId'] for item in search_response['items']]
+                videos = []
+                video_ids = [item['id']['videoId'] for item in search_response['items']]
             
-            if not video_ids:
-                return json.dumps({
-                    'search_query': topic,
-                    'total_found': 0,
-                    'search_date': datetime.now().isoformat(),
-                    'videos': [],
-                    'message': 'No videos found for this topic'
-                })
+                if not video_ids:
+                    return json.dumps({
+                        'search_query': topic,
+                        'total_found': 0,
+                        'search_date': datetime.now().isoformat(),
+                        'videos': [],
+                        'message': 'No videos found for this topic'
+                    })
             
-            # Get additional video details
-            videos_response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
+                # Get additional video details
+                videos_response = self.youtube.videos().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(video_ids),
+                    fields=_VIDEO_FIELDS
+                ).execute()
             
-            for item in videos_response['items']:
-                # Parse duration
-                duration = self._parse_duration(item['contentDetails']['duration'])
+                # Topic words and the current time are the same for every video
+                topic_words = topic.lower().split()
+                now = datetime.now(timezone.utc)
+                
+                for item in videos_response['items']:
+                    # Parse duration
+                    duration = self._parse_duration(item['contentDetails']['duration'])
+                
+                    # Filter for videos with substantial content (at least 5 minutes)
+                    if duration < 300:
+                        continue
                 
-                # Filter for videos with substantial content (at least 5 minutes)
-                if duration < 300:
-                    continue
+                    # Alias the nested dicts read repeatedly below
+                    video_id = item['id']
+                    snippet = item['snippet']
+                    # Partial responses omit objects whose fields are all absent
+                    statistics = item.get('statistics', {})
                 
-                # Get full description (not truncated)
-                full_description = item['snippet'].get('description', '')
+                    # Get full description (not truncated)
+                    full_description = snippet.get('description', '')
                 
-                video_data = {
-                    'video_id': item['id'],
-                    'title': item['snippet']['title'],
-                    'description': full_description,
-                    'description_preview': full_description[:500] + '...' if len(full_description) > 500 else full_description,
-                    'published_at': item['snippet']['publishedAt'],
-                    'channel_title': item['snippet']['channelTitle'],
-                    'channel_id': item['snippet']['channelId'],
-                    'duration_seconds': duration,
-                    'duration_formatted': self._format_duration(duration),
-                    'view_count': int(item['statistics'].get('viewCount', 0)),
-                    'like_count': int(item['statistics'].get('likeCount', 0)),
-                    'comment_count': int(item['statistics'].get('commentCount', 0)),
-                    'thumbnail_url': item['snippet']['thumbnails'].get('high', {}).get('url', ''),
-                    'video_url': f"https://www.youtube.com/watch?v={item['id']}",
-                    'relevance_score': self._calculate_relevance_score(item, topic)
-                }
-                videos.append(video_data)
+                    video_data = {
+                        'video_id': video_id,
+                        'title': snippet['title'],
+                        'description': full_description,
+                        'description_preview': full_description[:500] + '...' if len(full_description) > 500 else full_description,
+                        'published_at': snippet['publishedAt'],
+                        'channel_title': snippet['channelTitle'],
+                        'channel_id': snippet['channelId'],
+                        'duration_seconds': duration,
+                        'duration_formatted': self._format_duration(duration),
+                        'view_count': int(statistics.get('viewCount', 0)),
+                        'like_count': int(statistics.get('likeCount', 0)),
+                        'comment_count': int(statistics.get('commentCount', 0)),
+                        'thumbnail_url': snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
+                        'video_url': f"https://www.youtube.com/watch?v={video_id}",
+                        'relevance_score': self._calculate_relevance_score(item, topic_words, duration, now)
+                    }
+                    videos.append(video_data)
             
-            # Sort by relevance score
-            videos.sort(key=lambda x: x['relevance_score'], reverse=True)
+                # Rank by relevance score (same order as a stable descending sort)
+                videos = heapq.nlargest(min(max_results, 50), videos, key=itemgetter('relevance_score'))
+                _search_cache.put(cache_key, videos)
             
             return json.dumps({
                 'search_query': topic,
@@ -125,7 +221,7 @@ class YouTubeSearchTool(BaseTool):
     
     def _parse_duration(self, duration_str: str) -> int:
         """Parse YouTube duration format (PT#M#S) to seconds"""
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
+        match = _DURATION_RE.match(duration_str)
         if not match:
             return 0
         
@@ -146,30 +242,30 @@ class YouTubeSearchTool(BaseTool):
         else:
             return f"{minutes:02d}:{secs:02d}"
     
-    def _calculate_relevance_score(self, video_item: Dict, topic: str) -> float:
-        """Calculate relevance score for ranking videos"""
+    def _calculate_relevance_score(self, video_item: Dict, topic_words: List[str], duration: int,
+                                   now: datetime) -> float:
+        """Calculate relevance score for ranking videos (duration already parsed, in seconds)"""
         score = 0.0
         
         # Title relevance (40% weight)
         title = video_item['snippet']['title'].lower()
-        topic_words = topic.lower().split()
         title_matches = sum(1 for word in topic_words if word in title)
         score += (title_matches / len(topic_words)) * 40
         
         # View count factor (20% weight)
-        view_count = int(video_item['statistics'].get('viewCount', 0))
+        statistics = video_item.get('statistics', {})
+        view_count = int(statistics.get('viewCount', 0))
         if view_count > 10000:
             score += min(20, view_count / 50000)
         
         # Engagement rate (20% weight)
-        likes = int(video_item['statistics'].get('likeCount', 0))
-        comments = int(video_item['statistics'].get('commentCount', 0))
+        likes = int(statistics.get('likeCount', 0))
+        comments = int(statistics.get('commentCount', 0))
         if view_count > 0:
             engagement_rate = (likes + comments * 2) / view_count
             score += min(20, engagement_rate * 1000000)
         
         # Duration preference (10% weight)
-        duration = self._parse_duration(video_item['contentDetails']['duration'])
         if 600 <= duration <= 1800:  # 10-30 minutes
             score += 10
         elif 300 <= duration < 600:  # 5-10 minutes
@@ -179,7 +275,7 @@ class YouTubeSearchTool(BaseTool):
         
         # Recency bonus (10% weight)
         published_date = datetime.fromisoformat(video_item['snippet']['publishedAt'].replace('Z', '+00:00'))
-        days_old = (datetime.now().replace(tzinfo=published_date.tzinfo) - published_date).days
+        days_old = (now - published_date).days
         if days_old <= 7:
             score += 10
         elif days_old <= 30:
@@ -206,28 +302,35 @@ class YouTubeTranscriptTool(BaseTool):
             JSON string with summarized transcript data and key insights
         """
         try:
+            cache_key = (video_id, language_preference)
+            cached = _transcript_cache.get(cache_key)
             try:
-                # Initialize YouTubeTranscriptApi and get transcript list
-                ytt_api = YouTubeTranscriptApi()
-                transcript_list = ytt_api.list(video_id)
-                
-                # Try to find transcript in preferred language
-                try:
-                    # Find transcript with language preference
-                    transcript = transcript_list.find_transcript([language_preference])
-                    fetched_transcript = transcript.fetch()
-                    source_type = "manual" if not transcript.is_generated else "auto-generated"
+                if cached is not None:
+                    transcript_data, language_code, source_type = cached
+                else:
+                    # Initialize YouTubeTranscriptApi and get transcript list
+                    ytt_api = YouTubeTranscriptApi()
+                    transcript_list = ytt_api.list(video_id)
                     
-                    # Convert FetchedTranscript to raw data
-                    transcript_data = fetched_transcript.to_raw_data()
+                    # Try to find transcript in preferred language
+                    try:
+                        # Find transcript with language preference
+                        transcript = transcript_list.find_transcript([language_preference])
+                        fetched_transcript = transcript.fetch()
+                        source_type = "manual" if not transcript.is_generated else "auto-generated"
+                        
+                        # Convert FetchedTranscript to raw data
+                        transcript_data = fetched_transcript.to_raw_data()
+                        
+                    except:
+                        # Fallback to any available English transcript
+                        transcript = transcript_list.find_generated_transcript(_FALLBACK_LANGUAGES)
+                        fetched_transcript = transcript.fetch()
+                        transcript_data = fetched_transcript.to_raw_data()
+                        source_type = "auto-generated"
                     
-                except:
-                    # Fallback to any available English transcript
-                    languages = ['en', 'en-US', 'en-GB', 'en-CA', 'en-AU']
-                    transcript = transcript_list.find_generated_transcript(languages)
-                    fetched_transcript = transcript.fetch()
-                    transcript_data = fetched_transcript.to_raw_data()
-                    source_type = "auto-generated"
+                    language_code = transcript.language_code
+                    _transcript_cache.put(cache_key, (transcript_data, language_code, source_type))
                     
             except (TranscriptsDisabled, NoTranscriptFound, Exception):
                 # Fallback: use video description if no transcript available
@@ -249,13 +352,14 @@ class YouTubeTranscriptTool(BaseTool):
                     'fallback_used': True
                 })
             
-            # Process and summarize transcript data
-            processed_data = self._process_and_summarize_transcript(transcript_data, max_summary_length)
-            quality_metrics = self._assess_transcript_quality(transcript_data)
+            # Process and summarize transcript data (both share one scan of the segments)
+            scan = self._scan_transcript(transcript_data)
+            processed_data = self._process_and_summarize_transcript(transcript_data, max_summary_length, scan)
+            quality_metrics = self._assess_transcript_quality(transcript_data, scan)
             
             return json.dumps({
                 'video_id': video_id,
-                'language': transcript.language_code,
+                'language': language_code,
                 'source_type': source_type,
                 'key_insights': processed_data['key_insights'],
                 'summary': processed_data['summary'],
@@ -283,24 +387,56 @@ class YouTubeTranscriptTool(BaseTool):
                 'extraction_timestamp': datetime.now().isoformat()
             })
     
-    def _process_and_summarize_transcript(self, transcript_data: List[Dict], max_length: int = 1000) -> Dict[str, Any]:
+    def _scan_transcript(self, transcript_data: List[Dict]) -> Dict[str, Any]:
+        """Join transcript text and gather segment, word and error-marker stats in one pass"""
+        texts = []
+        short_segments = 0
+        word_count = 0
+        unique_words = set()
+        error_count = 0
+        for item in transcript_data:
+            segment = item['text']
+            texts.append(segment)
+            if len(segment) < 10:
+                short_segments += 1
+            segment = segment.lower()
+            words = segment.split()
+            word_count += len(words)
+            unique_words.update(words)
+            error_count += sum(1 for _ in _ERROR_INDICATOR_RE.finditer(segment))
+        
+        return {
+            'full_text': ' '.join(texts),
+            'short_segments': short_segments,
+            'word_count': word_count,
+            'unique_word_count': len(unique_words),
+            'error_count': error_count
+        }
+    
+    def _process_and_summarize_transcript(self, transcript_data: List[Dict], max_length: int = 1000,
+                                          scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Process transcript and extract key insights instead of full text"""
-        full_text = ' '.join([item['text'] for item in transcript_data])
-        word_count = len(full_text.split())
+        if scan is None:
+            scan = self._scan_transcript(transcript_data)
+        full_text = scan['full_text']
+        word_count = scan['word_count']
         duration = transcript_data[-1]['start'] + transcript_data[-1]['duration'] if transcript_data else 0
         
         # Clean up the text
-        full_text = re.sub(r'\[.*?\]', '', full_text)  # Remove timestamps and annotations
-        full_text = re.sub(r'\s+', ' ', full_text).strip()  # Normalize whitespace
+        full_text = _BRACKET_RE.sub('', full_text)  # Remove timestamps and annotations
+        full_text = _WS_RE.sub(' ', full_text).strip()  # Normalize whitespace
+        
+        # Split into sentences once; insights, quotes and the summary all use them
+        sentences = [sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(full_text)]
         
         # Extract key components
-        key_insights = self._extract_key_insights(full_text)
+        key_insights = self._extract_key_insights(sentences)
         topics = self._extract_topics(full_text)
-        quotes = self._extract_important_quotes(full_text)
+        quotes = self._extract_important_quotes(sentences)
         statistics = self._extract_statistics(full_text)
         
         # Create a concise summary
-        summary = self._create_summary(full_text, max_length)
+        summary = self._create_summary(sentences, max_length)
         
         return {
             'key_insights': key_insights,
@@ -313,25 +449,16 @@ class YouTubeTranscriptTool(BaseTool):
             'duration': duration
         }
     
-    def _extract_key_insights(self, text: str) -> List[str]:
-        """Extract key insights and main points from transcript"""
+    def _extract_key_insights(self, sentences: List[str]) -> List[str]:
+        """Extract key insights and main points from stripped transcript sentences"""
         insights = []
         
         # Look for sentences with key insight indicators
-        sentences = re.split(r'[.!?]+', text)
-        insight_keywords = [
-            'important', 'key', 'crucial', 'essential', 'main point',
-            'remember', 'tip', 'advice', 'recommendation', 'secret',
-            'mistake', 'avoid', 'best practice', 'lesson', 'takeaway'
-        ]
-        
         for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20:  # Avoid very short sentences
-                for keyword in insight_keywords:
-                    if keyword in sentence.lower():
-                        insights.append(sentence[:200] + '...' if len(sentence) > 200 else sentence)
-                        break
+            if len(sentence) > 20 and _INSIGHT_RE.search(sentence.lower()):  # Avoid very short sentences
+                insights.append(sentence[:200] + '...' if len(sentence) > 200 else sentence)
+                if len(insights) == 5:
+                    break
         
         # Return top 5 insights
         return insights[:5]
@@ -339,74 +466,46 @@ class YouTubeTranscriptTool(BaseTool):
     def _extract_topics(self, text: str) -> List[str]:
         """Extract main topics using keyword analysis"""
         # Remove common words and extract meaningful terms
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-        common_words = {
-            'that', 'this', 'with', 'have', 'will', 'been', 'were', 'said', 
-            'what', 'your', 'they', 'them', 'like', 'just', 'know', 'think',
-            'really', 'going', 'want', 'need', 'make', 'time', 'people'
-        }
-        meaningful_words = [word for word in words if word not in common_words]
+        words = _TOPIC_WORD_RE.findall(text.lower())
         
         # Get most frequent terms
-        word_counts = Counter(meaningful_words)
+        word_counts = Counter(word for word in words if word not in _COMMON_WORDS)
         return [word for word, count in word_counts.most_common(10)]
     
-    def _extract_important_quotes(self, text: str) -> List[str]:
-        """Extract important quotes or statements"""
+    def _extract_important_quotes(self, sentences: List[str]) -> List[str]:
+        """Extract important quotes or statements from stripped transcript sentences"""
         quotes = []
         
         # Look for quoted text or emphatic statements
-        sentences = re.split(r'[.!?]+', text)
-        quote_indicators = [
-            '"', "'", 'i believe', 'i think', 'in my opinion',
-            'the key is', 'what matters', 'most important'
-        ]
-        
         for sentence in sentences:
-            sentence = sentence.strip()
-            if 30 <= len(sentence) <= 150:  # Good quote length
-                for indicator in quote_indicators:
-                    if indicator in sentence.lower():
-                        quotes.append(sentence)
-                        break
+            if 30 <= len(sentence) <= 150 and _QUOTE_RE.search(sentence.lower()):  # Good quote length
+                quotes.append(sentence)
+                if len(quotes) == 3:
+                    break
         
         return quotes[:3]  # Top 3 quotes
     
     def _extract_statistics(self, text: str) -> List[str]:
         """Extract statistics and numerical data"""
-        statistics = []
-        
-        # Look for patterns with numbers and percentages
-        stat_patterns = [
-            r'\d+\s*percent',
-            r'\d+%',
-            r'\$\d+[\d,]*',
-            r'\d+\s*million',
-            r'\d+\s*billion',
-            r'\d+\s*times',
-            r'\d+\s*years?',
-            r'\d+\s*months?'
-        ]
-        
-        for pattern in stat_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Get surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].strip()
-                statistics.append(context)
-        
-        return list(set(statistics))[:5]  # Remove duplicates, top 5
-    
-    def _create_summary(self, text: str, max_length: int) -> str:
-        """Create a concise summary of the transcript"""
-        sentences = re.split(r'[.!?]+', text)
+        # Insertion-ordered dict: drops duplicate contexts, keeps text order
+        statistics = {}
+        
+        # Look for numbers and percentages in one scan of the text
+        for match in _STAT_RE.finditer(text):
+            # Get surrounding context
+            start = max(0, match.start() - 50)
+            context = text[start:match.end() + 50].strip()
+            statistics[context] = None
+            if len(statistics) == 5:  # Top 5 is all we return
+                break
         
+        return list(statistics)
+    
+    def _create_summary(self, sentences: List[str], max_length: int) -> str:
+        """Create a concise summary from stripped transcript sentences"""
         # Score sentences based on position and content
         scored_sentences = []
         for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
             if len(sentence) < 20:
                 continue
                 
@@ -419,8 +518,7 @@ class YouTubeTranscriptTool(BaseTool):
                 score += 1
             
             # Content scoring
-            important_words = ['important', 'key', 'main', 'summary', 'conclusion']
-            for word in important_words:
+            for word in _SUMMARY_WORDS:
                 if word in sentence.lower():
                     score += 1
             
@@ -457,7 +555,8 @@ class YouTubeTranscriptTool(BaseTool):
         
         return insights[:5]
     
-    def _assess_transcript_quality(self, transcript_data: List[Dict]) -> Dict[str, Any]:
+    def _assess_transcript_quality(self, transcript_data: List[Dict],
+                                   scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Assess the quality of the transcript for blog creation"""
         if not transcript_data:
             return {'quality_score': 0, 'issues': ['No transcript data'], 'recommended_for_blog': False}
@@ -465,21 +564,21 @@ class YouTubeTranscriptTool(BaseTool):
         issues = []
         quality_score = 100
         
+        if scan is None:
+            scan = self._scan_transcript(transcript_data)
+        word_count = scan['word_count']
+        
         # Check for very short segments
-        short_segments = sum(1 for item in transcript_data if len(item['text']) < 10)
-        if short_segments > len(transcript_data) * 0.3:
+        if scan['short_segments'] > len(transcript_data) * 0.3:
             issues.append('Many short transcript segments detected')
             quality_score -= 20
         
         # Check for repeated phrases
-        text = ' '.join([item['text'] for item in transcript_data])
-        words = text.lower().split()
-        if len(set(words)) < len(words) * 0.3:
+        if scan['unique_word_count'] < word_count * 0.3:
             issues.append('High repetition detected')
             quality_score -= 15
         
         # Check transcript length
-        word_count = len(words)
         if word_count < 500:
             issues.append('Transcript too short for substantial content')
             quality_score -= 25
@@ -488,9 +587,7 @@ class YouTubeTranscriptTool(BaseTool):
             # Don't penalize for long transcripts since we're summarizing
         
         # Check for common transcript errors
-        error_indicators = ['[Music]', '[Applause]', '[Inaudible]', 'um,', 'uh,', '...']
-        error_count = sum(text.lower().count(indicator.lower()) for indicator in error_indicators)
-        if error_count > 20:
+        if scan['error_count'] > 20:
             issues.append('High number of transcript errors detected')
             quality_score -= 10
         